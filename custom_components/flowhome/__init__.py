@@ -4,23 +4,77 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers import device_registry as dr
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .capture import TrafficCapture
+from .const import (
+    CONF_CHORE_ENTITIES,
+    CONF_RECORD_TRAFFIC,
+    DOMAIN,
+    PLATFORMS,
+    SERVICE_CLEAR_FAILED,
+    SERVICE_GET_CHORES,
+    SERVICE_GET_USERS,
+    SERVICE_REPLAY_CAPTURE,
+    SIGNAL_ENTRY_UNLOADED,
+)
 from .coordinator import FlowHomeCoordinator
 from .api import FlowHomeAPI
+from .mutations import FlowHomeMutationQueue
+from .query import CHORE_SORT_KEYS, USER_SORT_KEYS, query_chores, query_users
+from .replay import async_replay_capture
+from . import websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [
-    Platform.SENSOR,
-    Platform.BINARY_SENSOR,
-    Platform.BUTTON,
-]
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Tend websocket API and services that need no hub."""
+    websocket_api.async_setup(hass)
+    
+    async def handle_replay_capture(call: ServiceCall) -> ServiceResponse:
+        """Handle the replay_capture service call."""
+        path = call.data["path"]
+        if not hass.config.is_allowed_path(path):
+            raise HomeAssistantError(f"Access to {path} is not allowed")
+        # Mirror the configured entity options when there is an entry
+        entries = hass.config_entries.async_entries(DOMAIN)
+        options = dict(entries[0].options) if entries else {}
+        
+        return await async_replay_capture(hass, path, call.data["speed"], options)
+    
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY_CAPTURE,
+        handle_replay_capture,
+        schema=vol.Schema(
+            {
+                vol.Required("path"): cv.string,
+                vol.Optional("speed", default=1.0): vol.All(
+                    vol.Coerce(float), vol.Range(min=0.1)
+                ),
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -35,7 +89,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         api_key=entry.data.get("api_key"),
     )
     
-    coordinator = FlowHomeCoordinator(hass, api)
+    if entry.options.get(CONF_RECORD_TRAFFIC, False):
+        api.capture = TrafficCapture(
+            hass, hass.config.path(f"flowhome_capture_{entry.entry_id}.jsonl.gz")
+        )
+        entry.async_on_unload(api.capture.async_flush)
+        _LOGGER.info("Recording Tend API traffic to %s", api.capture.path)
+    
+    queue = FlowHomeMutationQueue(hass, api, entry.entry_id)
+    await queue.async_load()
+    
+    coordinator = FlowHomeCoordinator(hass, api, queue)
     await coordinator.async_config_entry_first_refresh()
     
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -51,53 +115,141 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sw_version=coordinator.data.get("version", "unknown"),
     )
     
+    if not entry.options.get(CONF_CHORE_ENTITIES, True):
+        _async_remove_chore_entities(hass, entry)
+    
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
     # Register services
-    async def handle_complete_chore(call: ServiceCall) -> None:
+    async def handle_complete_chore(call: ServiceCall) -> ServiceResponse:
         """Handle the complete_chore service call."""
         chore_id = call.data.get("chore_id")
         user_id = call.data.get("user_id")
         
-        await api.complete_chore(chore_id, user_id)
-        await coordinator.async_request_refresh()
+        return await coordinator.async_complete_chore(chore_id, user_id)
     
-    async def handle_skip_chore(call: ServiceCall) -> None:
+    async def handle_skip_chore(call: ServiceCall) -> ServiceResponse:
         """Handle the skip_chore service call."""
         chore_id = call.data.get("chore_id")
         user_id = call.data.get("user_id")
         reason = call.data.get("reason", "No reason provided")
         
-        await api.skip_chore(chore_id, user_id, reason)
-        await coordinator.async_request_refresh()
+        return await coordinator.async_skip_chore(chore_id, user_id, reason)
     
     hass.services.async_register(
         DOMAIN,
         "complete_chore",
         handle_complete_chore,
-        schema={
-            "chore_id": str,
-            "user_id": str,
-        },
+        schema=vol.Schema(
+            {
+                vol.Required("chore_id"): cv.string,
+                vol.Required("user_id"): cv.string,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
     )
     
     hass.services.async_register(
         DOMAIN,
         "skip_chore",
         handle_skip_chore,
-        schema={
-            "chore_id": str,
-            "user_id": str,
-            "reason": str,
-        },
+        schema=vol.Schema(
+            {
+                vol.Required("chore_id"): cv.string,
+                vol.Required("user_id"): cv.string,
+                vol.Optional("reason"): cv.string,
+            }
+        ),
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    
+    async def handle_clear_failed(call: ServiceCall) -> None:
+        """Handle the clear_failed_actions service call."""
+        await coordinator.async_clear_failed(call.data["retry"])
+    
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CLEAR_FAILED,
+        handle_clear_failed,
+        schema=vol.Schema(
+            {
+                vol.Optional("retry", default=False): cv.boolean,
+            }
+        ),
+    )
+    
+    async def handle_get_chores(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_chores service call."""
+        chores = query_chores(coordinator, **call.data)
+        return {"count": len(chores), "chores": chores}
+    
+    async def handle_get_users(call: ServiceCall) -> ServiceResponse:
+        """Handle the get_users service call."""
+        users = query_users(coordinator, **call.data)
+        return {"count": len(users), "users": users}
+    
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_CHORES,
+        handle_get_chores,
+        schema=vol.Schema(
+            {
+                vol.Optional("room"): cv.string,
+                vol.Optional("assignee"): cv.string,
+                vol.Optional("overdue"): cv.boolean,
+                vol.Optional("due_after"): cv.datetime,
+                vol.Optional("due_before"): cv.datetime,
+                vol.Optional("min_points"): vol.Coerce(float),
+                vol.Optional("max_points"): vol.Coerce(float),
+                vol.Optional("sort_by", default="next_due"): vol.In(CHORE_SORT_KEYS),
+                vol.Optional("descending", default=False): cv.boolean,
+                vol.Optional("limit"): cv.positive_int,
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
+    )
+    
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_USERS,
+        handle_get_users,
+        schema=vol.Schema(
+            {
+                vol.Optional("user"): cv.string,
+                vol.Optional("min_points"): vol.Coerce(float),
+                vol.Optional("sort_by", default="points"): vol.In(USER_SORT_KEYS),
+                vol.Optional("descending", default=True): cv.boolean,
+                vol.Optional("limit"): cv.positive_int,
+            }
+        ),
+        supports_response=SupportsResponse.ONLY,
     )
     
     return True
 
 
+@callback
+def _async_remove_chore_entities(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove per-chore entities left over from before they were turned off."""
+    entity_registry = er.async_get(hass)
+    prefix = f"{entry.entry_id}_chore_"
+    for entity in er.async_entries_for_config_entry(entity_registry, entry.entry_id):
+        if entity.unique_id.startswith(prefix):
+            entity_registry.async_remove(entity.entity_id)
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: FlowHomeCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # Websocket subscribers would otherwise keep the old coordinator alive
+        async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED.format(entry.entry_id))
+        await coordinator.async_shutdown()
     
     return unload_ok
@@ -2,17 +2,112 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import asdict, dataclass
+from datetime import date, datetime
 import logging
-from typing import Any
+import time
+from typing import TYPE_CHECKING, Any
 
 import aiohttp
+from aiohttp import compression_utils
 import async_timeout
+import cbor2
+import msgpack
 from urllib.parse import urlparse
 
+from homeassistant.util.json import json_loads
+
 from .const import DEFAULT_PORT
 
+if TYPE_CHECKING:
+    from .capture import TrafficCapture
+
 _LOGGER = logging.getLogger(__name__)
 
+CONTENT_TYPE_MSGPACK = ("application/msgpack", "application/x-msgpack")
+CONTENT_TYPE_CBOR = "application/cbor"
+
+# Only advertise the encodings aiohttp can decode here
+ACCEPT_ENCODING = ", ".join(
+    encoding
+    for encoding, supported in (
+        ("zstd", getattr(compression_utils, "HAS_ZSTD", False)),
+        ("br", getattr(compression_utils, "HAS_BROTLI", False)),
+        ("gzip", True),
+        ("deflate", True),
+    )
+    if supported
+)
+ACCEPT = ", ".join(
+    (
+        *CONTENT_TYPE_MSGPACK,
+        f"{CONTENT_TYPE_CBOR};q=0.9",
+        "application/json;q=0.5",
+    )
+)
+
+
+@dataclass
+class TransferStats:
+    """Byte counters for one API endpoint."""
+    
+    requests: int = 0
+    decoded_bytes: int = 0
+    # Only responses whose wire size is known count towards these
+    wire_bytes: int = 0
+    measured_bytes: int = 0
+    unmeasured: int = 0
+    content_type: str | None = None
+    content_encoding: str | None = None
+    
+    @property
+    def savings(self) -> float | None:
+        """Return the fraction of decoded bytes saved on the wire, if known."""
+        if not self.measured_bytes:
+            return None
+        return 1 - self.wire_bytes / self.measured_bytes
+
+
+class FlowHomeResponseError(ConnectionError):
+    """Error to indicate the API rejected a request."""
+    
+    def __init__(self, status: int, message: str) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.status = status
+
+
+def _decode_body(content_type: str, body: bytes) -> Any:
+    """Decode a response body according to its content type."""
+    if not body.strip():
+        return None
+    if content_type in CONTENT_TYPE_MSGPACK:
+        # timestamp=3 turns the Timestamp extension into a datetime
+        return _as_json(
+            msgpack.unpackb(body, raw=False, strict_map_key=False, timestamp=3)
+        )
+    if content_type == CONTENT_TYPE_CBOR:
+        return _as_json(cbor2.loads(body))
+    return json_loads(body)
+
+
+def _as_json(value: Any) -> Any:
+    """Return a decoded payload in the shape JSON would have produced.
+    
+    Binary formats carry native dates and non-string map keys; the
+    normalizers expect ISO strings and string keys.
+    """
+    if isinstance(value, dict):
+        return {
+            key if isinstance(key, str) else str(key): _as_json(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_as_json(item) for item in value]
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
 
 class FlowHomeAPI:
     """FlowHome API client."""
@@ -38,6 +133,19 @@ class FlowHomeAPI:
         if self._port:
             base += f":{self._port}"
         self._base_url = f"{base}/api"
+        self._transfer_stats: dict[str, TransferStats] = {}
+        self.capture: TrafficCapture | None = None
+    
+    @property
+    def transfer_stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-endpoint byte counters."""
+        return {
+            endpoint: {
+                **asdict(stats),
+                "savings": None if stats.savings is None else round(stats.savings, 3),
+            }
+            for endpoint, stats in self._transfer_stats.items()
+        }
     
     async def async_get_info(self) -> dict[str, Any]:
         """Get FlowHome app info."""
@@ -55,20 +163,35 @@ class FlowHomeAPI:
         """Get leaderboard data."""
         return await self._request("GET", "/leaderboard")
     
-    async def complete_chore(self, chore_id: str, user_id: str) -> None:
-        """Mark a chore as complete."""
-        await self._request(
+    async def complete_chore(
+        self,
+        chore_id: str,
+        user_id: str,
+        idempotency_key: str | None = None,
+    ) -> Any:
+        """Mark a chore as complete and return the updated records."""
+        return await self._request(
             "POST",
             f"/chores/{chore_id}/complete",
             json={"user_id": user_id},
+            endpoint="/chores/{chore_id}/complete",
+            idempotency_key=idempotency_key,
         )
     
-    async def skip_chore(self, chore_id: str, user_id: str, reason: str) -> None:
-        """Skip a chore."""
-        await self._request(
+    async def skip_chore(
+        self,
+        chore_id: str,
+        user_id: str,
+        reason: str,
+        idempotency_key: str | None = None,
+    ) -> Any:
+        """Skip a chore and return the updated records."""
+        return await self._request(
             "POST",
             f"/chores/{chore_id}/skip",
             json={"user_id": user_id, "reason": reason},
+            endpoint="/chores/{chore_id}/skip",
+            idempotency_key=idempotency_key,
         )
     
     async def _request(
@@ -76,12 +199,45 @@ class FlowHomeAPI:
         method: str,
         path: str,
         json: dict[str, Any] | None = None,
+        endpoint: str | None = None,
+        idempotency_key: str | None = None,
     ) -> Any:
         """Make a request to the API."""
-        headers = {}
+        headers = {
+            "Accept": ACCEPT,
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
         if self._api_key:
             headers["Authorization"] = f"Bearer {self._api_key}"
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
         
+        started = time.monotonic()
+        try:
+            return await self._async_send(method, path, json, headers, endpoint, started)
+        except ConnectionError as err:
+            if self.capture is not None:
+                self.capture.record(
+                    method,
+                    path,
+                    json,
+                    headers,
+                    time.monotonic() - started,
+                    status=getattr(err, "status", None),
+                    error=str(err),
+                )
+            raise
+    
+    async def _async_send(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None,
+        headers: dict[str, str],
+        endpoint: str | None,
+        started: float,
+    ) -> Any:
+        """Send a request and decode the response."""
         url = f"{self._base_url}{path}"
         
         try:
@@ -93,8 +249,72 @@ class FlowHomeAPI:
                     headers=headers,
                 ) as response:
                     response.raise_for_status()
-                    return await response.json()
+                    body = await response.read()
+                    wire_bytes = self._record_transfer(endpoint or path, response, body)
+                    try:
+                        result = _decode_body(response.content_type, body)
+                    except ValueError as err:
+                        if method == "GET":
+                            raise
+                        # The server accepted the mutation; an unreadable body
+                        # only means there are no records to patch with
+                        _LOGGER.debug(
+                            "Ignoring undecodable %s response from %s: %s",
+                            response.content_type,
+                            path,
+                            err,
+                        )
+                        result = None
+                    if self.capture is not None:
+                        self.capture.record(
+                            method,
+                            path,
+                            json,
+                            headers,
+                            time.monotonic() - started,
+                            status=response.status,
+                            response_headers=response.headers,
+                            wire_bytes=wire_bytes,
+                            decoded_bytes=len(body),
+                            payload=result,
+                        )
+                    return result
         except asyncio.TimeoutError as err:
             raise ConnectionError("Timeout connecting to FlowHome") from err
+        except aiohttp.ClientResponseError as err:
+            raise FlowHomeResponseError(
+                err.status, f"FlowHome rejected the request: {err.status} {err.message}"
+            ) from err
         except aiohttp.ClientError as err:
             raise ConnectionError(f"Error connecting to FlowHome: {err}") from err
+        except ValueError as err:
+            raise ConnectionError(f"Invalid response from FlowHome: {err}") from err
+    
+    def _record_transfer(
+        self,
+        endpoint: str,
+        response: aiohttp.ClientResponse,
+        body: bytes,
+    ) -> int | None:
+        """Update the byte counters for an endpoint and return the wire size."""
+        stats = self._transfer_stats.setdefault(endpoint, TransferStats())
+        encoding = response.headers.get(aiohttp.hdrs.CONTENT_ENCODING)
+        # aiohttp decompresses transparently; Content-Length is the size on
+        # the wire when the server sent one. A chunked response is only
+        # measurable when it was not compressed.
+        if response.content_length is not None:
+            wire_bytes: int | None = response.content_length
+        elif encoding in (None, "identity"):
+            wire_bytes = len(body)
+        else:
+            wire_bytes = None
+        stats.requests += 1
+        stats.decoded_bytes += len(body)
+        if wire_bytes is None:
+            stats.unmeasured += 1
+        else:
+            stats.wire_bytes += wire_bytes
+            stats.measured_bytes += len(body)
+        stats.content_type = response.content_type
+        stats.content_encoding = encoding
+        return wire_bytes
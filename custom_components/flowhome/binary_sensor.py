@@ -13,7 +13,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_CHORE_ENTITIES, DOMAIN
 from .coordinator import FlowHomeCoordinator
 
 
@@ -33,6 +33,9 @@ async def async_setup_entry(
     
     # Create binary sensors for each chore (overdue status)
     chores = coordinator.data.get("chores", [])
+    if not config_entry.options.get(CONF_CHORE_ENTITIES, True):
+        # Chores are only exposed as to-do items
+        chores = []
     for chore in chores:
         entities.append(
             FlowHomeBinarySensor(
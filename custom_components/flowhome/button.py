@@ -10,7 +10,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import CONF_CHORE_ENTITIES, DOMAIN
 from .coordinator import FlowHomeCoordinator
 
 
@@ -30,6 +30,9 @@ async def async_setup_entry(
     
     # Create complete button for each chore
     chores = coordinator.data.get("chores", [])
+    if not config_entry.options.get(CONF_CHORE_ENTITIES, True):
+        # Chores are only exposed as to-do items
+        chores = []
     for chore in chores:
         entities.append(
             FlowHomeButton(
@@ -73,5 +76,4 @@ class FlowHomeButton(CoordinatorEntity[FlowHomeCoordinator], ButtonEntity):
         users = self.coordinator.data.get("users", [])
         if users:
             user_id = users[0].get("id")
-            await self.coordinator.api.complete_chore(self._chore_id, user_id)
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_complete_chore(self._chore_id, user_id)
@@ -0,0 +1,106 @@
+"""Calendar platform for Tend."""
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .coordinator import FlowHomeCoordinator
+
+EVENT_DURATION = timedelta(hours=1)
+ALL_DAY_DURATION = timedelta(days=1)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the Tend chore calendar."""
+    coordinator: FlowHomeCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    
+    async_add_entities([FlowHomeCalendar(coordinator, config_entry)])
+
+
+class FlowHomeCalendar(CoordinatorEntity[FlowHomeCoordinator], CalendarEntity):
+    """Tend calendar of chore due dates."""
+    
+    _attr_icon = "mdi:calendar-check"
+    
+    def __init__(
+        self,
+        coordinator: FlowHomeCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the calendar."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{config_entry.entry_id}_chores_due"
+        self._attr_name = "Chores Due"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.data["host"])},
+            name="Tend",
+            manufacturer="Unburden LLP",
+            model="Tend Hub",
+        )
+    
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the chore in progress or due next."""
+        upcoming = self.coordinator.due_index.next_after(
+            dt_util.now() - EVENT_DURATION,
+            all_day_since=dt_util.start_of_local_day(),
+        )
+        if upcoming is None:
+            return None
+        return self._to_event(*upcoming)
+    
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[CalendarEvent]:
+        """Return chore occurrences that overlap a datetime range."""
+        due_index = self.coordinator.due_index
+        # Occurrences that started before the range may still be running
+        earliest = min(
+            start_date - EVENT_DURATION,
+            dt_util.start_of_local_day(dt_util.as_local(start_date)),
+        )
+        return [
+            self._to_event(due, chore_id)
+            for due, chore_id in due_index.between(earliest, end_date)
+            if due + self._duration(chore_id) > start_date
+        ]
+    
+    def _duration(self, chore_id: str) -> timedelta:
+        """Return how long each occurrence of a chore lasts."""
+        if chore_id in self.coordinator.due_index.all_day:
+            return ALL_DAY_DURATION
+        return EVENT_DURATION
+    
+    def _to_event(self, due: datetime, chore_id: str) -> CalendarEvent:
+        """Build a calendar event for one chore occurrence."""
+        chore = self.coordinator.chores_by_id[chore_id]
+        title = chore.get("title", "Unknown")
+        room = chore.get("room")
+        if chore_id in self.coordinator.due_index.all_day:
+            start: datetime | date = due.date()
+            end: datetime | date = start + ALL_DAY_DURATION
+        else:
+            start, end = due, due + EVENT_DURATION
+        return CalendarEvent(
+            start=start,
+            end=end,
+            summary=f"{title} ({room})" if room else title,
+            description=chore.get("description"),
+            location=room,
+            uid=f"{chore_id}_{due.isoformat()}",
+        )
@@ -0,0 +1,109 @@
+"""Opt-in capture of FlowHome API traffic for offline replay."""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+FLUSH_SIZE = 20
+# A capture left running rotates once this size is reached, keeping at most
+# the current file and the previous one
+MAX_CAPTURE_BYTES = 50 * 1024 * 1024
+REDACTED = "**REDACTED**"
+REDACT_HEADERS = {"authorization", "cookie", "set-cookie"}
+
+
+def _redact_headers(headers: Any) -> dict[str, str]:
+    """Return headers with credentials removed."""
+    return {
+        key: REDACTED if key.lower() in REDACT_HEADERS else value
+        for key, value in headers.items()
+    }
+
+
+def load_capture(path: str) -> list[dict[str, Any]]:
+    """Read every record from a capture file."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+class TrafficCapture:
+    """Append request/response records to a gzip-compressed JSON lines file."""
+    
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the capture."""
+        self._hass = hass
+        self.path = path
+        self.previous_path = f"{path.removesuffix('.jsonl.gz')}.1.jsonl.gz"
+        self._buffer: list[str] = []
+        self._lock = asyncio.Lock()
+    
+    def record(
+        self,
+        method: str,
+        path: str,
+        request_json: dict[str, Any] | None,
+        request_headers: dict[str, str],
+        elapsed: float,
+        *,
+        status: int | None = None,
+        response_headers: Any = None,
+        wire_bytes: int | None = None,
+        decoded_bytes: int | None = None,
+        payload: Any = None,
+        error: str | None = None,
+    ) -> None:
+        """Buffer one request/response exchange."""
+        self._buffer.append(
+            json.dumps(
+                {
+                    "t": round(time.time() - elapsed, 6),
+                    "method": method,
+                    "path": path,
+                    "request": request_json,
+                    "request_headers": _redact_headers(request_headers),
+                    "elapsed": round(elapsed, 6),
+                    "status": status,
+                    "response_headers": (
+                        _redact_headers(response_headers) if response_headers else None
+                    ),
+                    "wire_bytes": wire_bytes,
+                    "decoded_bytes": decoded_bytes,
+                    "payload": payload,
+                    "error": error,
+                },
+                separators=(",", ":"),
+                default=str,
+            )
+        )
+        if len(self._buffer) >= FLUSH_SIZE:
+            self._hass.async_create_task(self.async_flush())
+    
+    async def async_flush(self) -> None:
+        """Write buffered records to disk."""
+        async with self._lock:
+            if not self._buffer:
+                return
+            lines, self._buffer = self._buffer, []
+            await self._hass.async_add_executor_job(self._write, lines)
+    
+    def _write(self, lines: list[str]) -> None:
+        """Append records as a new gzip member, rotating a full capture."""
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= MAX_CAPTURE_BYTES:
+            os.replace(self.path, self.previous_path)
+            _LOGGER.info(
+                "FlowHome capture reached %s bytes; moved it to %s",
+                MAX_CAPTURE_BYTES,
+                self.previous_path,
+            )
+        with gzip.open(self.path, "at", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        _LOGGER.debug("Captured %s FlowHome exchanges to %s", len(lines), self.path)
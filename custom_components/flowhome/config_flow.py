@@ -9,12 +9,20 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.components import zeroconf
 from homeassistant.const import CONF_HOST, CONF_NAME, CONF_PORT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, DEFAULT_PORT
+from .const import (
+    CONF_CHORE_ENTITIES,
+    CONF_RECORD_TRAFFIC,
+    CONF_TODO_GROUP_BY,
+    DEFAULT_PORT,
+    DOMAIN,
+    TODO_GROUP_HOUSEHOLD,
+    TODO_GROUP_OPTIONS,
+)
 from .api import FlowHomeAPI
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,6 +57,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     
     VERSION = 1
     
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+    
     def __init__(self) -> None:
         """Initialize."""
         self._discovered_host: str | None = None
@@ -136,6 +152,42 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle Tend options."""
+    
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+    
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+        
+        options = self._entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_CHORE_ENTITIES,
+                        default=options.get(CONF_CHORE_ENTITIES, True),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TODO_GROUP_BY,
+                        default=options.get(CONF_TODO_GROUP_BY, TODO_GROUP_HOUSEHOLD),
+                    ): vol.In(TODO_GROUP_OPTIONS),
+                    vol.Optional(
+                        CONF_RECORD_TRAFFIC,
+                        default=options.get(CONF_RECORD_TRAFFIC, False),
+                    ): bool,
+                }
+            ),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
@@ -1,8 +1,30 @@
 """Constants for the FlowHome integration."""
 
+from homeassistant.const import Platform
+
 DOMAIN = "flowhome"
 DEFAULT_PORT = 8080
 
+PLATFORMS: list[Platform] = [
+    Platform.SENSOR,
+    Platform.BINARY_SENSOR,
+    Platform.BUTTON,
+    Platform.TODO,
+    Platform.CALENDAR,
+]
+
+# Options
+CONF_CHORE_ENTITIES = "chore_entities"
+CONF_TODO_GROUP_BY = "todo_group_by"
+CONF_RECORD_TRAFFIC = "record_traffic"
+TODO_GROUP_HOUSEHOLD = "household"
+TODO_GROUP_ROOM = "room"
+TODO_GROUP_ASSIGNEE = "assignee"
+TODO_GROUP_OPTIONS = [TODO_GROUP_HOUSEHOLD, TODO_GROUP_ROOM, TODO_GROUP_ASSIGNEE]
+
+# Dispatcher signals
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_entry_unloaded_{{}}"
+
 # Attributes
 ATTR_CHORE_ID = "chore_id"
 ATTR_USER_ID = "user_id"
@@ -20,4 +42,8 @@ ATTR_STREAK = "streak"
 # Services
 SERVICE_COMPLETE_CHORE = "complete_chore"
 SERVICE_SKIP_CHORE = "skip_chore"
-SERVICE_ASSIGN_CHORE = "assign_chore"
\ No newline at end of file
+SERVICE_ASSIGN_CHORE = "assign_chore"
+SERVICE_REPLAY_CAPTURE = "replay_capture"
+SERVICE_GET_CHORES = "get_chores"
+SERVICE_GET_USERS = "get_users"
+SERVICE_CLEAR_FAILED = "clear_failed_actions"
\ No newline at end of file
@@ -2,24 +2,52 @@
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass, field
 from datetime import timedelta
-import hashlib
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import FlowHomeAPI
 from .const import DOMAIN
+from .mutations import (
+    MUTATION_COMPLETE,
+    MUTATION_SKIP,
+    FlowHomeMutationQueue,
+    MutationResult,
+)
+from .query import ChoreIndex, UserIndex
+from .schedule import DueIndex
+from .schema import CHORE_FIELDS, USER_FIELDS, SchemaDetector, fallback_id
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass
+class RecordChanges:
+    """Record ids that changed between two coordinator snapshots."""
+    
+    added: set[str] = field(default_factory=set)
+    updated: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+    
+    @property
+    def changed(self) -> set[str]:
+        """Return ids that were added or updated."""
+        return self.added | self.updated
+
+
 class FlowHomeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """FlowHome data update coordinator."""
     
-    def __init__(self, hass: HomeAssistant, api: FlowHomeAPI) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: FlowHomeAPI,
+        queue: FlowHomeMutationQueue,
+    ) -> None:
         """Initialize coordinator."""
         super().__init__(
             hass,
@@ -28,9 +56,207 @@ class FlowHomeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(seconds=30),
         )
         self.api = api
+        self.queue = queue
+        self.chores_by_id: dict[str, dict[str, Any]] = {}
+        self.chore_changes = RecordChanges()
+        self.users_by_id: dict[str, dict[str, Any]] = {}
+        self.user_changes = RecordChanges()
+        self.due_index = DueIndex()
+        self.chore_index = ChoreIndex()
+        self.user_index = UserIndex()
+        self.chore_schema = SchemaDetector("chore", CHORE_FIELDS)
+        self.user_schema = SchemaDetector("user", USER_FIELDS)
+        # Bumped for every new snapshot, so listeners can tell it apart from
+        # a failed refresh that leaves the data untouched
+        self.revision = 0
+    
+    def user_id_for_chore(self, chore: dict[str, Any]) -> str | None:
+        """Return the user to credit for a chore, preferring its assignee."""
+        users = self.data.get("users", []) if self.data else []
+        assigned = chore.get("assigned_to")
+        if assigned:
+            for user in users:
+                if assigned in (user.get("id"), user.get("name")):
+                    return user.get("id")
+        return users[0].get("id") if users else None
+    
+    async def async_complete_chore(self, chore_id: str, user_id: str) -> dict[str, Any]:
+        """Complete a chore, queueing it while FlowHome is unreachable."""
+        result = await self.queue.async_submit(MUTATION_COMPLETE, chore_id, user_id)
+        return await self._async_apply_mutation(result, chore_id, user_id)
+    
+    async def async_skip_chore(
+        self, chore_id: str, user_id: str, reason: str
+    ) -> dict[str, Any]:
+        """Skip a chore, queueing it while FlowHome is unreachable."""
+        result = await self.queue.async_submit(MUTATION_SKIP, chore_id, user_id, reason)
+        return await self._async_apply_mutation(result, chore_id, user_id)
+    
+    async def async_clear_failed(self, retry: bool) -> None:
+        """Clear rejected mutations, or queue them again and try to send them."""
+        if not await self.queue.async_clear_failed(retry):
+            return
+        self._async_publish_pending()
+        if retry:
+            await self.async_request_refresh()
+    
+    async def _async_apply_mutation(
+        self, result: MutationResult, chore_id: str, user_id: str
+    ) -> dict[str, Any]:
+        """Update the snapshot after a mutation and describe the outcome."""
+        if result.queued:
+            self._async_publish_pending()
+            return {
+                "queued": True,
+                "idempotency_key": result.key,
+                "chore": self.chores_by_id.get(chore_id),
+                "user": self.users_by_id.get(user_id),
+            }
+        chore, user = self._async_patch(result.response, chore_id, user_id)
+        if chore is None and user is None:
+            # The response carried no records to patch with; fetch them now
+            # rather than through the debouncer so the reply is current
+            await self.async_refresh()
+            chore = self.chores_by_id.get(chore_id)
+            user = self.users_by_id.get(user_id)
+        return {
+            "queued": False,
+            "idempotency_key": result.key,
+            "chore": chore,
+            "user": user,
+        }
+    
+    @callback
+    def _async_patch(
+        self, response: Any, chore_id: str, user_id: str
+    ) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+        """Patch the snapshot with records from a mutation response.
+        
+        Accepts ``{"chore": {...}, "user": {...}}`` or a bare chore record
+        carrying the chore's id, either of which may be partial. Returns the patched chore and user.
+        """
+        if not isinstance(response, dict) or not self.data:
+            return None, None
+        chore_raw = response.get("chore")
+        if chore_raw is None and "user" not in response:
+            # Only a record that names this chore; anything else is an
+            # acknowledgement like {"status": "ok"} and says nothing about it
+            if chore_id in (response.get("id"), response.get("chore_id")):
+                chore_raw = response
+        user_raw = response.get("user")
+        
+        chores = self.data["chores"]
+        users = self.data["users"]
+        leaderboard = self.data["leaderboard"]
+        chore = user = None
+        if (
+            isinstance(chore_raw, dict)
+            and chore_id in self.chores_by_id
+            and (fields := self.chore_schema.patch(chore_raw))
+        ):
+            chore = {**self.chores_by_id[chore_id], **fields, "id": chore_id}
+            chores = [chore if c["id"] == chore_id else c for c in chores]
+        if (
+            isinstance(user_raw, dict)
+            and user_id in self.users_by_id
+            and (fields := self.user_schema.patch(user_raw))
+        ):
+            fields.pop("id", None)
+            user = {**self.users_by_id[user_id], **fields}
+            users = [user if u["id"] == user_id else u for u in users]
+            board = leaderboard.get("users")
+            if isinstance(board, dict) and user_id in board:
+                leaderboard = {
+                    **leaderboard,
+                    "users": {**board, user_id: {**board[user_id], **fields}},
+                }
+        if chore is None and user is None:
+            return None, None
+        
+        self.async_set_updated_data(
+            self._build_snapshot(self.data["info"], chores, users, leaderboard)
+        )
+        return chore, user
+    
+    @callback
+    def _async_publish_pending(self) -> None:
+        """Show queued mutations on the current snapshot without a refresh."""
+        if not self.data:
+            return
+        self.data = self._build_snapshot(
+            self.data["info"],
+            self.data["chores"],
+            self.data["users"],
+            self.data["leaderboard"],
+        )
+        # Leave last_update_success alone; the API is still unreachable
+        self.async_update_listeners()
+    
+    def _normalize_chore(self, raw: dict[str, Any]) -> dict[str, Any]:
+        """Map upstream chore payload to the entity schema."""
+        chore = self.chore_schema.normalize(raw)
+        if not chore["id"] and chore["title"] != "Unknown":
+            # Fallback stable id based on title if API doesn't provide one
+            chore["id"] = fallback_id(chore["title"])
+        return chore
+    
+    def _apply_pending(self, chores: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return chores with queued mutations applied optimistically."""
+        pending = {mutation["chore_id"]: mutation for mutation in self.queue.pending}
+        if not pending:
+            return chores
+        result = []
+        for chore in chores:
+            if (mutation := pending.get(chore["id"])) is not None:
+                chore = {**chore, "is_overdue": False}
+                if mutation["kind"] == MUTATION_COMPLETE:
+                    chore["last_completed_at"] = mutation["created_at"]
+            result.append(chore)
+        return result
+    
+    def _build_snapshot(
+        self,
+        info: dict[str, Any],
+        chores: list[dict[str, Any]],
+        users: list[dict[str, Any]],
+        leaderboard: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Assemble coordinator data and update the change tracking."""
+        chores = self._apply_pending(chores)
+        self._track_chore_changes(chores)
+        self._track_user_changes(users)
+        self.revision += 1
+        return {
+            "info": info,
+            "chores": chores,
+            "users": users,
+            "leaderboard": leaderboard,
+            "version": info.get("version", "unknown"),
+            "queue": {
+                "pending": len(self.queue.pending),
+                "failed": len(self.queue.failed),
+            },
+        }
+    
+    def _track_chore_changes(self, chores: list[dict[str, Any]]) -> None:
+        """Diff the new chore list against the previous snapshot."""
+        current = {chore["id"]: chore for chore in chores}
+        self.chore_changes = _diff_records(self.chores_by_id, current)
+        self.chores_by_id = current
+        self.due_index.apply(current, self.chore_changes)
+        self.chore_index.apply(current, self.chore_changes)
+    
+    def _track_user_changes(self, users: list[dict[str, Any]]) -> None:
+        """Diff the new user list against the previous snapshot."""
+        current = {user["id"]: user for user in users}
+        self.user_changes = _diff_records(self.users_by_id, current)
+        self.users_by_id = current
+        self.user_index.apply(current, self.user_changes)
     
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint."""
+        # Flush mutations made while offline before reading fresh state
+        await self.queue.async_replay()
         try:
             # Fetch all data in parallel
             info, chores_raw, users_raw, leaderboard_raw = await asyncio.gather(
@@ -40,56 +266,29 @@ class FlowHomeCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 self.api.async_get_leaderboard(),
             )
             
-            chores = [_normalize_chore(chore) for chore in chores_raw]
-            chores = [c for c in chores if c.get("id")]
-            users = [_normalize_user(user) for user in users_raw]
-            users = [u for u in users if u.get("id")]
+            chores = [self._normalize_chore(chore) for chore in chores_raw]
+            chores = [c for c in chores if c["id"]]
+            users = [self.user_schema.normalize(user) for user in users_raw]
+            users = [u for u in users if u["id"]]
             # If leaderboard is missing, derive a basic one from users
             leaderboard = leaderboard_raw or {"users": {u["id"]: u for u in users}}
             
-            return {
-                "info": info,
-                "chores": chores,
-                "users": users,
-                "leaderboard": leaderboard,
-                "version": info.get("version", "unknown"),
-            }
+            return self._build_snapshot(info, chores, users, leaderboard)
         except ConnectionError as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
     # Note: executor-based fetch was replaced with direct asyncio.gather above.
 
 
-def _normalize_chore(chore: dict[str, Any]) -> dict[str, Any]:
-    """Map upstream chore payload to the entity schema."""
-    title = chore.get("title") or chore.get("name") or "Unknown"
-    cid = chore.get("id") or chore.get("chore_id")
-    if not cid and title != "Unknown":
-        # Fallback stable id based on title if API doesn't provide one
-        cid = hashlib.md5(title.encode("utf-8")).hexdigest()
-    return {
-        "id": cid,
-        "title": title,
-        "description": chore.get("description"),
-        "points": chore.get("points"),
-        "assigned_to": chore.get("assigned_to"),
-        # Store status in frequency slot for lack of a better upstream field
-        "frequency": chore.get("frequency") or chore.get("status"),
-        "difficulty": chore.get("difficulty"),
-        "room": chore.get("room"),
-        "next_due": chore.get("next_due") or chore.get("due_at"),
-        "last_completed_at": chore.get("last_completed_at") or chore.get("completed_at"),
-        "is_overdue": chore.get("is_overdue", False),
-    }
-
-
-def _normalize_user(user: dict[str, Any]) -> dict[str, Any]:
-    """Map upstream user payload to the entity schema."""
-    return {
-        "id": user.get("id") or user.get("user_id"),
-        "name": user.get("name") or user.get("display_name") or "Unknown",
-        "points": user.get("points", 0),
-        "streak": user.get("streak") or user.get("streak_days", 0),
-        "completed_today": user.get("completed_today", 0),
-        "completed_week": user.get("completed_week", 0),
-        "rank": user.get("rank"),
-    }
+def _diff_records(
+    previous: dict[str, dict[str, Any]],
+    current: dict[str, dict[str, Any]],
+) -> RecordChanges:
+    """Return which record ids were added, updated or removed."""
+    return RecordChanges(
+        added=current.keys() - previous.keys(),
+        updated={
+            rid for rid, record in current.items()
+            if rid in previous and previous[rid] != record
+        },
+        removed=previous.keys() - current.keys(),
+    )
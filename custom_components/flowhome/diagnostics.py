@@ -0,0 +1,41 @@
+"""Diagnostics support for Tend."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import FlowHomeCoordinator
+
+TO_REDACT = {"api_key"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: FlowHomeCoordinator = hass.data[DOMAIN][entry.entry_id]
+    
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "chores": len(coordinator.chores_by_id),
+        "users": len(coordinator.data.get("users", [])),
+        "transfer": coordinator.api.transfer_stats,
+        "schema": {
+            "chores": {
+                "shapes": coordinator.chore_schema.shapes,
+                "unmapped": coordinator.chore_schema.unmapped,
+            },
+            "users": {
+                "shapes": coordinator.user_schema.shapes,
+                "unmapped": coordinator.user_schema.unmapped,
+            },
+        },
+        "queue": {
+            "pending": coordinator.queue.pending,
+            "failed": coordinator.queue.failed,
+        },
+    }
@@ -0,0 +1,200 @@
+"""Durable queue for chore mutations made while FlowHome is unreachable."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+from typing import Any
+from uuid import uuid4
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import FlowHomeAPI, FlowHomeResponseError
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+REPLAY_BATCH_SIZE = 20
+MAX_FAILED = 50
+
+MUTATION_COMPLETE = "complete"
+MUTATION_SKIP = "skip"
+
+# Client errors that mean "not now" rather than "never"
+TRANSIENT_STATUSES = {408, 425, 429}
+
+
+def _is_rejection(err: BaseException) -> bool:
+    """Return True if the API refused a mutation and retrying cannot help."""
+    return (
+        isinstance(err, FlowHomeResponseError)
+        and err.status < 500
+        and err.status not in TRANSIENT_STATUSES
+    )
+
+
+@dataclass
+class MutationResult:
+    """Outcome of submitting a mutation."""
+    
+    key: str
+    queued: bool
+    response: Any = None
+
+
+class FlowHomeMutationQueue:
+    """Ordered, persisted queue of complete/skip calls with idempotency keys."""
+    
+    def __init__(self, hass: HomeAssistant, api: FlowHomeAPI, entry_id: str) -> None:
+        """Initialize the queue."""
+        self.api = api
+        self._store: Store[dict[str, list[dict[str, Any]]]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.mutations"
+        )
+        self._lock = asyncio.Lock()
+        self.pending: list[dict[str, Any]] = []
+        self.failed: list[dict[str, Any]] = []
+    
+    async def async_load(self) -> None:
+        """Load queued mutations from storage."""
+        if stored := await self._store.async_load():
+            self.pending = stored.get("pending", [])
+            self.failed = stored.get("failed", [])
+    
+    async def async_submit(
+        self,
+        kind: str,
+        chore_id: str,
+        user_id: str,
+        reason: str | None = None,
+    ) -> MutationResult:
+        """Send a mutation, queueing it if FlowHome is unreachable.
+        
+        The result carries the API response body, or ``queued`` if the
+        mutation was stored for replay. Client errors from the API are raised
+        to the caller rather than queued.
+        """
+        mutation = {
+            "key": uuid4().hex,
+            "kind": kind,
+            "chore_id": chore_id,
+            "user_id": user_id,
+            "reason": reason,
+            "created_at": dt_util.utcnow().isoformat(),
+        }
+        async with self._lock:
+            # Keep ordering: nothing jumps ahead of mutations already waiting
+            if not self.pending:
+                try:
+                    response = await self._async_send(mutation)
+                except ConnectionError as err:
+                    if _is_rejection(err):
+                        raise
+                    _LOGGER.warning(
+                        "FlowHome unreachable, queueing %s of chore %s: %s",
+                        kind,
+                        chore_id,
+                        err,
+                    )
+                else:
+                    return MutationResult(mutation["key"], False, response)
+            self.pending.append(mutation)
+            await self._async_save()
+        return MutationResult(mutation["key"], True)
+    
+    async def async_replay(self) -> int:
+        """Replay queued mutations in batches until the queue is empty or the API fails.
+        
+        Returns the number of mutations that reached the API.
+        """
+        sent = 0
+        async with self._lock:
+            while self.pending:
+                batch = self._next_batch()
+                results = await asyncio.gather(
+                    *(self._async_send(mutation) for mutation in batch),
+                    return_exceptions=True,
+                )
+                unreachable = False
+                for mutation, result in zip(batch, results):
+                    if not isinstance(result, BaseException):
+                        self.pending.remove(mutation)
+                        sent += 1
+                    elif isinstance(result, ConnectionError) and not _is_rejection(result):
+                        unreachable = True
+                    else:
+                        self.pending.remove(mutation)
+                        self._fail(mutation, result)
+                await self._async_save()
+                if unreachable:
+                    break
+        if sent:
+            _LOGGER.debug("Replayed %s queued FlowHome mutations", sent)
+        return sent
+    
+    async def async_clear_failed(self, retry: bool = False) -> int:
+        """Empty the failed list, optionally queueing its mutations again.
+        
+        Retried mutations keep their idempotency keys. Returns how many
+        mutations were taken off the failed list.
+        """
+        async with self._lock:
+            cleared = len(self.failed)
+            if retry:
+                self.pending.extend(
+                    {key: value for key, value in mutation.items() if key != "error"}
+                    for mutation in self.failed
+                )
+            self.failed = []
+            await self._async_save()
+        return cleared
+    
+    def _next_batch(self) -> list[dict[str, Any]]:
+        """Return the oldest queued mutation of each chore, up to the batch size.
+        
+        Later mutations of the same chore wait for the next batch so each chore
+        sees its mutations in the order they were made.
+        """
+        batch: list[dict[str, Any]] = []
+        chore_ids: set[str] = set()
+        for mutation in self.pending:
+            if mutation["chore_id"] in chore_ids:
+                continue
+            chore_ids.add(mutation["chore_id"])
+            batch.append(mutation)
+            if len(batch) == REPLAY_BATCH_SIZE:
+                break
+        return batch
+    
+    def _fail(self, mutation: dict[str, Any], err: BaseException) -> None:
+        """Move a mutation the API will never accept to the failed list."""
+        _LOGGER.error(
+            "Dropping queued %s of chore %s: %s",
+            mutation["kind"],
+            mutation["chore_id"],
+            err,
+        )
+        self.failed.append({**mutation, "error": str(err)})
+        del self.failed[:-MAX_FAILED]
+    
+    async def _async_send(self, mutation: dict[str, Any]) -> Any:
+        """Send one mutation to the API and return the response body."""
+        if mutation["kind"] == MUTATION_SKIP:
+            return await self.api.skip_chore(
+                mutation["chore_id"],
+                mutation["user_id"],
+                mutation["reason"],
+                idempotency_key=mutation["key"],
+            )
+        return await self.api.complete_chore(
+            mutation["chore_id"],
+            mutation["user_id"],
+            idempotency_key=mutation["key"],
+        )
+    
+    async def _async_save(self) -> None:
+        """Persist the queue."""
+        await self._store.async_save({"pending": self.pending, "failed": self.failed})
@@ -0,0 +1,230 @@
+"""Indexed read-only queries over the coordinator snapshot."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import datetime
+import math
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from .coordinator import FlowHomeCoordinator, RecordChanges
+
+CHORE_SORT_KEYS = ["next_due", "points", "title", "room"]
+USER_SORT_KEYS = ["points", "streak", "name", "rank"]
+
+
+def _number(value: Any) -> float | None:
+    """Return a value usable as a numeric sort/range key."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _aware(value: datetime | None) -> datetime | None:
+    """Treat naive service datetimes as local time."""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return value
+
+
+class ChoreIndex:
+    """Secondary indexes over chores, maintained from per-refresh changes."""
+    
+    def __init__(self) -> None:
+        """Initialize empty indexes."""
+        self.by_room: defaultdict[str | None, set[str]] = defaultdict(set)
+        self.by_assignee: defaultdict[str | None, set[str]] = defaultdict(set)
+        self.overdue: set[str] = set()
+        self._points: list[tuple[float, str]] = []
+        self._keys: dict[str, tuple[str | None, str | None, float | None]] = {}
+    
+    def apply(
+        self,
+        chores_by_id: dict[str, dict[str, Any]],
+        changes: RecordChanges,
+    ) -> None:
+        """Update the indexes for chores that changed since the last snapshot."""
+        for chore_id in changes.removed | changes.updated:
+            self._remove(chore_id)
+        for chore_id in changes.changed:
+            self._add(chore_id, chores_by_id[chore_id])
+    
+    def points_between(self, low: float | None, high: float | None) -> set[str]:
+        """Return chores worth between ``low`` and ``high`` points, inclusive."""
+        start = 0 if low is None else bisect_left(self._points, (low,))
+        stop = (
+            len(self._points)
+            if high is None
+            else bisect_left(self._points, (math.nextafter(high, math.inf),))
+        )
+        return {chore_id for _, chore_id in self._points[start:stop]}
+    
+    def _add(self, chore_id: str, chore: dict[str, Any]) -> None:
+        """Index one chore."""
+        room = chore.get("room")
+        assignee = chore.get("assigned_to")
+        points = _number(chore.get("points"))
+        self.by_room[room].add(chore_id)
+        self.by_assignee[assignee].add(chore_id)
+        if chore.get("is_overdue"):
+            self.overdue.add(chore_id)
+        if points is not None:
+            insort(self._points, (points, chore_id))
+        self._keys[chore_id] = (room, assignee, points)
+    
+    def _remove(self, chore_id: str) -> None:
+        """Drop a chore from every index."""
+        if (keys := self._keys.pop(chore_id, None)) is None:
+            return
+        room, assignee, points = keys
+        for index, key in ((self.by_room, room), (self.by_assignee, assignee)):
+            index[key].discard(chore_id)
+            if not index[key]:
+                del index[key]
+        self.overdue.discard(chore_id)
+        if points is not None:
+            del self._points[bisect_left(self._points, (points, chore_id))]
+
+
+class UserIndex:
+    """Lookup of users by id or display name."""
+    
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self.by_name: defaultdict[str, set[str]] = defaultdict(set)
+        self._names: dict[str, str] = {}
+    
+    def apply(
+        self,
+        users_by_id: dict[str, dict[str, Any]],
+        changes: RecordChanges,
+    ) -> None:
+        """Update the index for users that changed since the last snapshot."""
+        for user_id in changes.removed | changes.updated:
+            if (name := self._names.pop(user_id, None)) is not None:
+                self.by_name[name].discard(user_id)
+                if not self.by_name[name]:
+                    del self.by_name[name]
+        for user_id in changes.changed:
+            name = users_by_id[user_id].get("name")
+            self._names[user_id] = name
+            self.by_name[name].add(user_id)
+    
+    def resolve(self, user: str, users_by_id: dict[str, Any]) -> set[str]:
+        """Return the ids of users matching an id or a name."""
+        ids = set(self.by_name.get(user, ()))
+        if user in users_by_id:
+            ids.add(user)
+        return ids
+
+
+def assignee_keys(coordinator: FlowHomeCoordinator, assignee: str) -> set[str]:
+    """Return every ``assigned_to`` value that refers to a user id or name.
+    
+    Chores may be assigned by user id or by name, so both forms of each
+    matching user are included.
+    """
+    keys = {assignee}
+    for user_id in coordinator.user_index.resolve(assignee, coordinator.users_by_id):
+        keys.update((user_id, coordinator.users_by_id[user_id].get("name")))
+    return keys
+
+
+def _sorted(
+    records: list[dict[str, Any]],
+    key: Any,
+    descending: bool,
+) -> list[dict[str, Any]]:
+    """Sort records by a key, keeping records without a value last."""
+    keyed = [(key(record), record) for record in records]
+    present = [item for item in keyed if item[0] is not None]
+    present.sort(key=lambda item: item[0], reverse=descending)
+    return [record for _, record in present] + [
+        record for value, record in keyed if value is None
+    ]
+
+
+def query_chores(
+    coordinator: FlowHomeCoordinator,
+    *,
+    room: str | None = None,
+    assignee: str | None = None,
+    overdue: bool | None = None,
+    due_after: datetime | None = None,
+    due_before: datetime | None = None,
+    min_points: float | None = None,
+    max_points: float | None = None,
+    sort_by: str = "next_due",
+    descending: bool = False,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Return chores matching every given filter.
+    
+    Each filter is answered from an index and the smallest candidate set is
+    intersected with the rest, so cost follows the result, not the household.
+    """
+    index = coordinator.chore_index
+    candidates: list[set[str]] = []
+    if room is not None:
+        candidates.append(index.by_room.get(room, set()))
+    if assignee is not None:
+        keys = assignee_keys(coordinator, assignee)
+        candidates.append(set().union(*(index.by_assignee.get(key, ()) for key in keys)))
+    if overdue:
+        candidates.append(index.overdue)
+    if due_after is not None or due_before is not None:
+        candidates.append(
+            coordinator.due_index.ids_between(_aware(due_after), _aware(due_before))
+        )
+    if min_points is not None or max_points is not None:
+        candidates.append(index.points_between(min_points, max_points))
+    
+    if candidates:
+        candidates.sort(key=len)
+        chore_ids = candidates[0].intersection(*candidates[1:])
+    else:
+        chore_ids = set(coordinator.chores_by_id)
+    if overdue is False:
+        chore_ids -= index.overdue
+    
+    chores = [coordinator.chores_by_id[chore_id] for chore_id in chore_ids]
+    if sort_by == "next_due":
+        chores = _sorted(
+            chores, lambda chore: coordinator.due_index.due(chore["id"]), descending
+        )
+    elif sort_by == "points":
+        chores = _sorted(chores, lambda chore: _number(chore.get("points")), descending)
+    else:
+        chores = _sorted(chores, lambda chore: chore.get(sort_by), descending)
+    return chores[:limit]
+
+
+def query_users(
+    coordinator: FlowHomeCoordinator,
+    *,
+    user: str | None = None,
+    min_points: float | None = None,
+    sort_by: str = "points",
+    descending: bool = True,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Return household members matching the given filters."""
+    if user is not None:
+        user_ids = coordinator.user_index.resolve(user, coordinator.users_by_id)
+        users = [coordinator.users_by_id[user_id] for user_id in user_ids]
+    else:
+        users = list(coordinator.users_by_id.values())
+    if min_points is not None:
+        users = [
+            record for record in users
+            if (points := _number(record.get("points"))) is not None
+            and points >= min_points
+        ]
+    if sort_by == "name":
+        users = _sorted(users, lambda record: record.get("name"), descending)
+    else:
+        users = _sorted(users, lambda record: _number(record.get(sort_by)), descending)
+    return users[:limit]
@@ -0,0 +1,255 @@
+"""Replay captured FlowHome traffic through a private coordinator and platforms."""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable
+from functools import partial
+import importlib
+import logging
+import statistics
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity import Entity
+
+from .api import FlowHomeAPI, FlowHomeResponseError
+from .capture import load_capture
+from .const import DOMAIN, PLATFORMS
+from .coordinator import FlowHomeCoordinator
+from .mutations import FlowHomeMutationQueue
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ReplayAPI(FlowHomeAPI):
+    """FlowHome API client answering from a capture instead of the network."""
+    
+    def __init__(self, records: list[dict[str, Any]], speed: float) -> None:
+        """Initialize the replay client."""
+        super().__init__(session=None, host="replay")
+        self._speed = speed
+        self._responses: dict[tuple[str, str], deque[dict[str, Any]]] = defaultdict(deque)
+        for record in records:
+            self._responses[(record["method"], record["path"])].append(record)
+        self.network_time = 0.0
+        self.unmatched = 0
+    
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None = None,
+        endpoint: str | None = None,
+        idempotency_key: str | None = None,
+    ) -> Any:
+        """Answer with the next recorded exchange for this request."""
+        if not (recorded := self._responses.get((method, path))):
+            self.unmatched += 1
+            raise ConnectionError(f"No recorded response for {method} {path}")
+        record = recorded.popleft()
+        delay = record["elapsed"] / self._speed
+        self.network_time += delay
+        await asyncio.sleep(delay)
+        if record["error"]:
+            if record["status"]:
+                raise FlowHomeResponseError(record["status"], record["error"])
+            raise ConnectionError(record["error"])
+        return record["payload"]
+
+
+class ReplayEntry:
+    """Stand-in config entry for platforms set up against a replay."""
+    
+    def __init__(self, options: dict[str, Any]) -> None:
+        """Initialize the stand-in entry."""
+        self.entry_id = f"{DOMAIN}_replay"
+        self.data = {"host": "replay"}
+        self.options = options
+        self._on_unload: list[Callable[[], None]] = []
+    
+    def async_on_unload(self, func: Callable[[], None]) -> None:
+        """Remember a callback to run when the replay ends."""
+        self._on_unload.append(func)
+    
+    @callback
+    def async_unload(self) -> None:
+        """Run the unload callbacks."""
+        while self._on_unload:
+            self._on_unload.pop()()
+
+
+class ReplayEntities:
+    """Platform entities driven by the replay, kept out of the state machine.
+    
+    Each entity's state write is replaced by computing the state and
+    attributes, which is what a real write costs, and counting it as a write
+    when they changed, which is when the recorder would store one.
+    """
+    
+    def __init__(self, hass: HomeAssistant, coordinator: FlowHomeCoordinator) -> None:
+        """Initialize the collection."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._states: dict[int, tuple[Any, ...]] = {}
+        self._unsubs: list[Callable[[], None]] = []
+        self.entities: list[Entity] = []
+        self.state_writes = 0
+    
+    @callback
+    def async_add_entities(
+        self, new_entities: Iterable[Entity], update_before_add: bool = False
+    ) -> None:
+        """Attach new entities to the replay coordinator."""
+        for entity in new_entities:
+            entity.hass = self._hass
+            entity.async_write_ha_state = partial(self._async_write_state, entity)
+            self._states[id(entity)] = _calculate_state(entity)
+            self._unsubs.append(
+                self._coordinator.async_add_listener(entity._handle_coordinator_update)
+            )
+            self.entities.append(entity)
+    
+    @callback
+    def _async_write_state(self, entity: Entity) -> None:
+        """Compute the state an entity would write and count real changes."""
+        state = _calculate_state(entity)
+        if state != self._states[id(entity)]:
+            self._states[id(entity)] = state
+            self.state_writes += 1
+    
+    @callback
+    def async_detach(self) -> None:
+        """Stop driving the entities."""
+        while self._unsubs:
+            self._unsubs.pop()()
+
+
+def _calculate_state(entity: Entity) -> tuple[Any, ...]:
+    """Return what a state write of the entity would store."""
+    return (
+        entity.available,
+        entity.state,
+        entity.state_attributes,
+        entity.extra_state_attributes,
+    )
+
+
+def _refresh_times(records: list[dict[str, Any]]) -> list[float]:
+    """Return when each captured refresh started, one per chores fetch."""
+    return [
+        record["t"]
+        for record in records
+        if record["method"] == "GET" and record["path"] == "/chores"
+    ]
+
+
+def _summarize(samples: list[float]) -> dict[str, float]:
+    """Return latency statistics in milliseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    return {
+        "mean": round(statistics.fmean(ordered) * 1000, 3),
+        "p50": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "max": round(ordered[-1] * 1000, 3),
+    }
+
+
+async def async_replay_capture(
+    hass: HomeAssistant,
+    path: str,
+    speed: float = 1.0,
+    options: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Drive a private coordinator with captured traffic and report what it cost.
+    
+    The coordinator, its entities and its mutation queue exist only for the
+    replay, so no live entry, network access or state machine is involved.
+    The first captured refresh sets up the entities; the rest are measured,
+    spaced as they were captured and divided by ``speed``. Event loop time is
+    the CPU time of the loop thread while each refresh runs, which covers
+    normalization and every entity update it triggers (plus any other work
+    the loop picked up meanwhile).
+    """
+    records = await hass.async_add_executor_job(load_capture, path)
+    refresh_times = _refresh_times(records)
+    if not refresh_times:
+        raise HomeAssistantError(f"{path} holds no captured refreshes")
+    replay_api = ReplayAPI(records, speed)
+    queue = FlowHomeMutationQueue(hass, replay_api, f"{DOMAIN}_replay")
+    coordinator = FlowHomeCoordinator(hass, replay_api, queue)
+    # Refreshes are driven by the capture's timing, never by the interval
+    coordinator.update_interval = None
+    entry = ReplayEntry(options or {})
+    entities = ReplayEntities(hass, coordinator)
+    
+    latencies: list[float] = []
+    loop_times: list[float] = []
+    failures = 0
+    try:
+        await coordinator.async_refresh()
+        if not coordinator.last_update_success:
+            raise HomeAssistantError(
+                f"The first refresh in {path} failed: {coordinator.last_exception}"
+            )
+        await _async_setup_platforms(hass, coordinator, entry, entities)
+        state_writes_before = entities.state_writes
+        
+        previous = refresh_times[0]
+        for started_at in refresh_times[1:]:
+            await asyncio.sleep(max(0.0, started_at - previous) / speed)
+            previous = started_at
+            wall_start = time.monotonic()
+            cpu_start = time.thread_time()
+            await coordinator.async_refresh()
+            loop_times.append(time.thread_time() - cpu_start)
+            latencies.append(time.monotonic() - wall_start)
+            if not coordinator.last_update_success:
+                failures += 1
+        state_writes = entities.state_writes - state_writes_before
+    finally:
+        entities.async_detach()
+        entry.async_unload()
+        await coordinator.async_shutdown()
+    
+    _LOGGER.debug("Replayed %s refreshes from %s", len(latencies), path)
+    return {
+        "records": len(records),
+        "entities": len(entities.entities),
+        "refreshes": len(latencies),
+        "failed_refreshes": failures,
+        "unmatched_requests": replay_api.unmatched,
+        "speed": speed,
+        "refresh_latency_ms": _summarize(latencies),
+        "simulated_network_seconds": round(replay_api.network_time, 3),
+        "event_loop_seconds": round(sum(loop_times), 6),
+        "event_loop_ms_per_refresh": _summarize(loop_times),
+        "state_writes": state_writes,
+        "state_writes_per_refresh": (
+            round(state_writes / len(latencies), 1) if latencies else 0
+        ),
+    }
+
+
+async def _async_setup_platforms(
+    hass: HomeAssistant,
+    coordinator: FlowHomeCoordinator,
+    entry: ReplayEntry,
+    entities: ReplayEntities,
+) -> None:
+    """Create every platform's entities for the replay coordinator."""
+    # Platforms look their coordinator up by entry id while they set up
+    coordinators: dict[str, FlowHomeCoordinator] = hass.data.setdefault(DOMAIN, {})
+    coordinators[entry.entry_id] = coordinator
+    try:
+        for platform in PLATFORMS:
+            module = await hass.async_add_executor_job(
+                importlib.import_module, f"{__package__}.{platform}"
+            )
+            await module.async_setup_entry(hass, entry, entities.async_add_entities)
+    finally:
+        coordinators.pop(entry.entry_id, None)
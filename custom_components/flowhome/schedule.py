@@ -0,0 +1,243 @@
+"""Time-indexed schedule of chore due dates."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+import calendar
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from .coordinator import RecordChanges
+
+# Upstream frequency values that repeat; anything else is a one-off chore
+RECURRENCE_DAYS = {
+    "daily": 1,
+    "weekly": 7,
+    "biweekly": 14,
+    "fortnightly": 14,
+}
+RECURRENCE_MONTHS = {
+    "monthly": 1,
+    "quarterly": 3,
+    "yearly": 12,
+    "annually": 12,
+}
+
+SECONDS_PER_DAY = 86400
+# Repeats keep wall-clock time, so their phase drifts across DST changes
+PHASE_SLACK = timedelta(hours=2)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    """Add calendar months, clamping to the end of shorter months."""
+    month = value.month - 1 + months
+    year = value.year + month // 12
+    month = month % 12 + 1
+    day = min(value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+
+def parse_due(value: str | None) -> datetime | date | None:
+    """Parse an upstream due value into an aware datetime or a date."""
+    if not value:
+        return None
+    if (parsed := dt_util.parse_datetime(value)) is not None:
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        return parsed
+    return dt_util.parse_date(value)
+
+
+def _due_datetime(due: datetime | date) -> datetime:
+    """Return a sortable aware datetime for a due value."""
+    if isinstance(due, datetime):
+        return due
+    return datetime.combine(due, time.min, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+
+
+def _phase(due: datetime, days: int) -> float:
+    """Return how far into a ``days``-long period a due time falls, in seconds."""
+    return due.timestamp() % (days * SECONDS_PER_DAY)
+
+
+def _in_phase(
+    phases: list[tuple[float, str]],
+    days: int,
+    start: datetime,
+    end: datetime,
+) -> list[str]:
+    """Return chores of one period bucket that may repeat within ``[start, end)``."""
+    period = days * SECONDS_PER_DAY
+    span = (end - start + 2 * PHASE_SLACK).total_seconds()
+    if span >= period:
+        return [chore_id for _, chore_id in phases]
+    low = (start - PHASE_SLACK).timestamp() % period
+    high = low + span
+    found = phases[bisect_left(phases, (low,)) : bisect_left(phases, (high,))]
+    if high > period:
+        # The window wraps past the end of the period
+        found += phases[: bisect_left(phases, (high - period,))]
+    return [chore_id for _, chore_id in found]
+
+
+def _first_from(
+    entries: list[tuple[datetime, str]], when: datetime
+) -> tuple[datetime, str] | None:
+    """Return the first entry at or after ``when`` in a sorted list."""
+    position = bisect_left(entries, (when,))
+    return entries[position] if position < len(entries) else None
+
+
+class DueIndex:
+    """Sorted index of chore due times supporting range and next-due queries.
+    
+    Entries are ``(due, chore_id)`` tuples kept in order with ``bisect`` so a
+    range query costs ``O(log n)`` plus the size of the result. Recurring
+    chores are bucketed by period and ordered by where in the period they
+    fall, so a window shorter than the period only expands the chores that
+    can repeat inside it.
+    """
+    
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._entries: list[tuple[datetime, str]] = []
+        # Daily/weekly chores bucketed by period, ordered by phase in it
+        self._recurring_days: dict[int, list[tuple[float, str]]] = {}
+        self._recurring_months: list[tuple[datetime, str]] = []
+        self._due: dict[str, datetime] = {}
+        self._all_day_entries: list[tuple[datetime, str]] = []
+        self.all_day: set[str] = set()
+        self._recurrence: dict[str, tuple[int, int]] = {}
+    
+    def __len__(self) -> int:
+        """Return the number of indexed chores."""
+        return len(self._entries)
+    
+    def apply(
+        self,
+        chores_by_id: dict[str, dict[str, Any]],
+        changes: RecordChanges,
+    ) -> None:
+        """Update the index for chores that changed since the last snapshot."""
+        for chore_id in changes.removed | changes.updated:
+            self._remove(chore_id)
+        for chore_id in changes.changed:
+            self._add(chore_id, chores_by_id[chore_id])
+    
+    def between(self, start: datetime, end: datetime) -> list[tuple[datetime, str]]:
+        """Return occurrences due in ``[start, end)`` in due order.
+        
+        Recurring chores repeat from their next due date at their frequency.
+        """
+        low = bisect_left(self._entries, (start,))
+        high = bisect_left(self._entries, (end,))
+        occurrences = [
+            entry for entry in self._entries[low:high]
+            if entry[1] not in self._recurrence
+        ]
+        for days, phases in self._recurring_days.items():
+            for chore_id in _in_phase(phases, days, start, end):
+                self._expand(occurrences, chore_id, start, end)
+        for _, chore_id in self._recurring_months[
+            : bisect_left(self._recurring_months, (end,))
+        ]:
+            self._expand(occurrences, chore_id, start, end)
+        occurrences.sort()
+        return occurrences
+    
+    def due(self, chore_id: str) -> datetime | None:
+        """Return when a chore is next due."""
+        return self._due.get(chore_id)
+    
+    def ids_between(self, start: datetime | None, end: datetime | None) -> set[str]:
+        """Return chores whose next due time is in ``[start, end)``."""
+        low = 0 if start is None else bisect_left(self._entries, (start,))
+        high = len(self._entries) if end is None else bisect_left(self._entries, (end,))
+        return {chore_id for _, chore_id in self._entries[low:high]}
+    
+    def next_after(
+        self, when: datetime, all_day_since: datetime | None = None
+    ) -> tuple[datetime, str] | None:
+        """Return the first chore due at or after ``when``.
+        
+        All-day chores count from ``all_day_since`` instead when given, so one
+        due today can still be current after ``when`` has passed midnight.
+        """
+        candidates = [_first_from(self._entries, when)]
+        if all_day_since is not None:
+            candidates.append(_first_from(self._all_day_entries, all_day_since))
+        return min((entry for entry in candidates if entry), default=None)
+    
+    def _expand(
+        self,
+        occurrences: list[tuple[datetime, str]],
+        chore_id: str,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """Append the repeats of one recurring chore that fall in ``[start, end)``."""
+        if (due := self._due[chore_id]) >= end:
+            return
+        days, months = self._recurrence[chore_id]
+        # Jump to just before the window; the step back absorbs DST and
+        # time zone differences between the due date and the window
+        if months:
+            elapsed = (start.year - due.year) * 12 + start.month - due.month
+            step = max(0, elapsed // months - 1)
+        else:
+            step = max(0, (start - due) // timedelta(days=days) - 1)
+        while True:
+            occurrence = (
+                _add_months(due, months * step)
+                if months
+                else due + timedelta(days=days * step)
+            )
+            if occurrence >= end:
+                return
+            if occurrence >= start:
+                occurrences.append((occurrence, chore_id))
+            step += 1
+    
+    def _add(self, chore_id: str, chore: dict[str, Any]) -> None:
+        """Index one chore by its next due time."""
+        if (due := parse_due(chore.get("next_due"))) is None:
+            return
+        all_day = not isinstance(due, datetime)
+        due = _due_datetime(due)
+        self._due[chore_id] = due
+        insort(self._entries, (due, chore_id))
+        if all_day:
+            self.all_day.add(chore_id)
+            insort(self._all_day_entries, (due, chore_id))
+        frequency = str(chore.get("frequency") or "").lower()
+        if frequency in RECURRENCE_DAYS:
+            days = RECURRENCE_DAYS[frequency]
+            self._recurrence[chore_id] = (days, 0)
+            insort(
+                self._recurring_days.setdefault(days, []),
+                (_phase(due, days), chore_id),
+            )
+        elif frequency in RECURRENCE_MONTHS:
+            self._recurrence[chore_id] = (0, RECURRENCE_MONTHS[frequency])
+            insort(self._recurring_months, (due, chore_id))
+    
+    def _remove(self, chore_id: str) -> None:
+        """Drop a chore from the index."""
+        if (due := self._due.pop(chore_id, None)) is None:
+            return
+        del self._entries[bisect_left(self._entries, (due, chore_id))]
+        if chore_id in self.all_day:
+            self.all_day.discard(chore_id)
+            del self._all_day_entries[bisect_left(self._all_day_entries, (due, chore_id))]
+        if (recurrence := self._recurrence.pop(chore_id, None)) is None:
+            return
+        if days := recurrence[0]:
+            phases = self._recurring_days[days]
+            del phases[bisect_left(phases, (_phase(due, days), chore_id))]
+            if not phases:
+                del self._recurring_days[days]
+        else:
+            months = self._recurring_months
+            del months[bisect_left(months, (due, chore_id))]
@@ -0,0 +1,174 @@
+"""Schema detection and compiled field mappers for upstream payloads."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+import hashlib
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_SHAPES = 16
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """One entity schema field and the upstream keys it may come from.
+    
+    Without ``coalesce`` the first alias present is copied as-is, like
+    ``record.get(a, default)``. With it the first truthy alias wins, like
+    ``get(a) or get(b, default)``, and a ``fallback`` is appended as a final
+    ``or fallback`` operand.
+    """
+    
+    target: str
+    aliases: tuple[str, ...]
+    default: Any = None
+    coalesce: bool = False
+    fallback: Any = None
+
+
+CHORE_FIELDS = (
+    FieldSpec("id", ("id", "chore_id"), coalesce=True),
+    FieldSpec("title", ("title", "name"), coalesce=True, fallback="Unknown"),
+    FieldSpec("description", ("description",)),
+    FieldSpec("points", ("points",)),
+    FieldSpec("assigned_to", ("assigned_to",)),
+    # Store status in frequency slot for lack of a better upstream field
+    FieldSpec("frequency", ("frequency", "status"), coalesce=True),
+    FieldSpec("difficulty", ("difficulty",)),
+    FieldSpec("room", ("room",)),
+    FieldSpec("next_due", ("next_due", "due_at"), coalesce=True),
+    FieldSpec("last_completed_at", ("last_completed_at", "completed_at"), coalesce=True),
+    FieldSpec("is_overdue", ("is_overdue",), False),
+)
+
+USER_FIELDS = (
+    FieldSpec("id", ("id", "user_id"), coalesce=True),
+    FieldSpec("name", ("name", "display_name"), coalesce=True, fallback="Unknown"),
+    FieldSpec("points", ("points",), 0),
+    FieldSpec("streak", ("streak", "streak_days"), 0, coalesce=True),
+    FieldSpec("completed_today", ("completed_today",), 0),
+    FieldSpec("completed_week", ("completed_week",), 0),
+    FieldSpec("rank", ("rank",)),
+)
+
+
+@lru_cache(maxsize=1024)
+def fallback_id(title: str) -> str:
+    """Return a stable id derived from a chore title."""
+    return hashlib.md5(title.encode("utf-8")).hexdigest()
+
+
+class RecordMapper:
+    """Field mapper specialized for one payload shape.
+    
+    Aliases are resolved against the shape's keys once, so mapping a record
+    is a fixed set of direct lookups with no probing of absent keys.
+    """
+    
+    def __init__(self, fields: tuple[FieldSpec, ...], keys: frozenset[str]) -> None:
+        """Compile the mapper for records with exactly these keys."""
+        self.keys = keys
+        self._constants: dict[str, Any] = {}
+        self._direct: list[tuple[str, str]] = []
+        self._coalesce: list[tuple[str, tuple[str, ...], str | None, Any]] = []
+        mapped: set[str] = set()
+        for spec in fields:
+            present = tuple(alias for alias in spec.aliases if alias in keys)
+            mapped.update(present)
+            if spec.fallback is not None:
+                # Nothing truthy: the fallback is the last operand
+                terminal, otherwise = None, spec.fallback
+            elif spec.aliases[-1] in keys:
+                # Nothing truthy: the last alias is returned even if falsy
+                terminal, otherwise = spec.aliases[-1], None
+            else:
+                terminal, otherwise = None, spec.default
+            if not present:
+                self._constants[spec.target] = (
+                    otherwise if spec.coalesce else spec.default
+                )
+            elif spec.coalesce:
+                self._coalesce.append((spec.target, present, terminal, otherwise))
+            else:
+                self._direct.append((spec.target, present[0]))
+        self.unmapped = keys - mapped
+        self.absent = frozenset(self._constants)
+    
+    def __call__(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Map one upstream record to the entity schema."""
+        result = self._constants.copy()
+        for target, key in self._direct:
+            result[target] = record[key]
+        for target, keys, terminal, otherwise in self._coalesce:
+            for key in keys:
+                if value := record[key]:
+                    break
+            else:
+                value = otherwise if terminal is None else record[terminal]
+            result[target] = value
+        return result
+
+
+class SchemaDetector:
+    """Pick the compiled mapper for each record of one endpoint.
+    
+    Records normally share a shape, so the last mapper is reused until a
+    record's keys differ; only then is a mapper looked up or compiled.
+    """
+    
+    def __init__(self, name: str, fields: tuple[FieldSpec, ...]) -> None:
+        """Initialize the detector."""
+        self._name = name
+        self._fields = fields
+        self._mappers: dict[frozenset[str], RecordMapper] = {}
+        self._current: RecordMapper | None = None
+    
+    @property
+    def unmapped(self) -> list[str]:
+        """Return upstream keys seen on this endpoint that no field uses."""
+        return sorted(
+            set().union(*(mapper.unmapped for mapper in self._mappers.values()))
+        )
+    
+    @property
+    def shapes(self) -> int:
+        """Return how many payload shapes have been compiled."""
+        return len(self._mappers)
+    
+    def mapper_for(self, record: dict[str, Any]) -> RecordMapper:
+        """Return the mapper for a record's shape."""
+        current = self._current
+        if current is not None and record.keys() == current.keys:
+            return current
+        keys = frozenset(record)
+        if (mapper := self._mappers.get(keys)) is None:
+            if len(self._mappers) >= MAX_SHAPES:
+                self._mappers.pop(next(iter(self._mappers)))
+            mapper = self._mappers[keys] = RecordMapper(self._fields, keys)
+            _LOGGER.debug(
+                "Detected new %s payload shape; unmapped fields: %s",
+                self._name,
+                sorted(mapper.unmapped),
+            )
+        self._current = mapper
+        return mapper
+    
+    def normalize(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Map one upstream record to the entity schema."""
+        return self.mapper_for(record)(record)
+    
+    def patch(self, record: dict[str, Any]) -> dict[str, Any]:
+        """Map only the fields a partial record actually carries.
+        
+        Partial records come from mutation responses, so their shapes are
+        compiled on the spot and kept out of the poll mappers and diagnostics.
+        """
+        mapper = RecordMapper(self._fields, frozenset(record))
+        return {
+            target: value
+            for target, value in mapper(record).items()
+            if target not in mapper.absent
+        }
@@ -18,7 +18,7 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, ATTR_POINTS, ATTR_STREAK, ATTR_USER_NAME
+from .const import CONF_CHORE_ENTITIES, DOMAIN, ATTR_POINTS, ATTR_STREAK, ATTR_USER_NAME
 from .coordinator import FlowHomeCoordinator
 
 
@@ -94,6 +94,9 @@ async def async_setup_entry(
     
     # Create sensors for each chore
     chores = coordinator.data.get("chores", [])
+    if not config_entry.options.get(CONF_CHORE_ENTITIES, True):
+        # Chores are only exposed as to-do items
+        chores = []
     for chore in chores:
         chore_id = chore.get("id")
         chore_name = chore.get("title", "Unknown")
@@ -128,6 +131,26 @@ async def async_setup_entry(
         )
     )
     
+    # Chore actions waiting for, or rejected by, the API
+    entities.extend(
+        FlowHomeSensor(
+            coordinator=coordinator,
+            config_entry=config_entry,
+            description=FlowHomeSensorEntityDescription(
+                key=f"queue_{status}",
+                name=name,
+                native_unit_of_measurement="actions",
+                state_class=SensorStateClass.MEASUREMENT,
+                icon=icon,
+                value_fn=lambda data, status=status: data.get("queue", {}).get(status, 0),
+            ),
+        )
+        for status, name, icon in (
+            ("pending", "Pending Chore Actions", "mdi:cloud-upload"),
+            ("failed", "Failed Chore Actions", "mdi:cloud-alert"),
+        )
+    )
+    
     async_add_entities(entities)
 
 
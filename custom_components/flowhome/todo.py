@@ -0,0 +1,204 @@
+"""To-do list platform for Tend."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.todo import (
+    TodoItem,
+    TodoItemStatus,
+    TodoListEntity,
+    TodoListEntityFeature,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import (
+    CONF_TODO_GROUP_BY,
+    DOMAIN,
+    TODO_GROUP_ASSIGNEE,
+    TODO_GROUP_HOUSEHOLD,
+    TODO_GROUP_ROOM,
+)
+from .coordinator import FlowHomeCoordinator
+from .schedule import parse_due
+
+
+def _group_key(chore: dict[str, Any], group_by: str) -> str | None:
+    """Return the list a chore belongs to for the configured grouping."""
+    if group_by == TODO_GROUP_ROOM:
+        return chore.get("room")
+    if group_by == TODO_GROUP_ASSIGNEE:
+        return chore.get("assigned_to")
+    return None
+
+
+def _list_unique_id(entry_id: str, group_by: str, group: str | None) -> str:
+    """Return the unique id of the list for one group."""
+    return f"{entry_id}_todo_{group_by}_{group or 'none'}"
+
+
+def _chore_to_item(chore: dict[str, Any]) -> TodoItem:
+    """Build a to-do item from a normalized chore."""
+    room = chore.get("room")
+    title = chore.get("title", "Unknown")
+    return TodoItem(
+        uid=chore["id"],
+        summary=f"{title} ({room})" if room else title,
+        status=TodoItemStatus.NEEDS_ACTION,
+        due=parse_due(chore.get("next_due")),
+        description=chore.get("description"),
+    )
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Tend to-do lists."""
+    coordinator: FlowHomeCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    group_by = config_entry.options.get(CONF_TODO_GROUP_BY, TODO_GROUP_HOUSEHOLD)
+    
+    # Wait for first data
+    if not coordinator.data:
+        await coordinator.async_request_refresh()
+    
+    known_groups: set[str | None] = set()
+    
+    @callback
+    def _async_add_new_lists(chore_ids: set[str] | None = None) -> None:
+        """Create a list for every group that does not have one yet."""
+        if group_by == TODO_GROUP_HOUSEHOLD:
+            groups: set[str | None] = {None}
+        else:
+            if chore_ids is None:
+                chore_ids = coordinator.chore_changes.changed
+            groups = {
+                _group_key(coordinator.chores_by_id[cid], group_by) for cid in chore_ids
+            }
+        new_groups = groups - known_groups
+        if not new_groups:
+            return
+        known_groups.update(new_groups)
+        async_add_entities(
+            FlowHomeTodoList(
+                coordinator=coordinator,
+                config_entry=config_entry,
+                group_by=group_by,
+                group=group,
+            )
+            for group in new_groups
+        )
+    
+    _async_add_new_lists(set(coordinator.chores_by_id))
+    _async_remove_stale_lists(
+        hass,
+        config_entry,
+        {
+            _list_unique_id(config_entry.entry_id, group_by, group)
+            for group in known_groups
+        },
+    )
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_add_new_lists))
+
+
+@callback
+def _async_remove_stale_lists(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    current: set[str],
+) -> None:
+    """Remove lists from an earlier grouping or for groups with no chores left."""
+    entity_registry = er.async_get(hass)
+    prefix = f"{config_entry.entry_id}_todo_"
+    for entity in er.async_entries_for_config_entry(
+        entity_registry, config_entry.entry_id
+    ):
+        if entity.unique_id.startswith(prefix) and entity.unique_id not in current:
+            entity_registry.async_remove(entity.entity_id)
+
+
+class FlowHomeTodoList(CoordinatorEntity[FlowHomeCoordinator], TodoListEntity):
+    """Tend to-do list holding chores as items."""
+    
+    _attr_icon = "mdi:broom"
+    _attr_supported_features = TodoListEntityFeature.UPDATE_TODO_ITEM
+    
+    def __init__(
+        self,
+        coordinator: FlowHomeCoordinator,
+        config_entry: ConfigEntry,
+        group_by: str,
+        group: str | None,
+    ) -> None:
+        """Initialize the to-do list."""
+        super().__init__(coordinator)
+        self._group_by = group_by
+        self._group = group
+        self._attr_unique_id = _list_unique_id(config_entry.entry_id, group_by, group)
+        self._attr_name = self._list_name()
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.data["host"])},
+            name="Tend",
+            manufacturer="Unburden LLP",
+            model="Tend Hub",
+        )
+        self._items: dict[str, TodoItem] = {
+            cid: _chore_to_item(chore)
+            for cid, chore in coordinator.chores_by_id.items()
+            if self._in_group(chore)
+        }
+    
+    def _list_name(self) -> str:
+        """Return the display name for this list."""
+        if self._group_by == TODO_GROUP_HOUSEHOLD:
+            return "Chores"
+        if self._group is None:
+            return "Unassigned Chores" if self._group_by == TODO_GROUP_ASSIGNEE else "Other Chores"
+        if self._group_by == TODO_GROUP_ASSIGNEE:
+            for user in self.coordinator.data.get("users", []):
+                if user.get("id") == self._group:
+                    return f"{user.get('name', self._group)} Chores"
+        return f"{self._group} Chores"
+    
+    def _in_group(self, chore: dict[str, Any]) -> bool:
+        """Return True if the chore belongs on this list."""
+        if self._group_by == TODO_GROUP_HOUSEHOLD:
+            return True
+        return _group_key(chore, self._group_by) == self._group
+    
+    @property
+    def todo_items(self) -> list[TodoItem]:
+        """Return the chores on this list."""
+        return list(self._items.values())
+    
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Apply only the chores that changed since the last refresh."""
+        changes = self.coordinator.chore_changes
+        for chore_id in changes.removed:
+            self._items.pop(chore_id, None)
+        for chore_id in changes.changed:
+            chore = self.coordinator.chores_by_id[chore_id]
+            if self._in_group(chore):
+                self._items[chore_id] = _chore_to_item(chore)
+            else:
+                self._items.pop(chore_id, None)
+        super()._handle_coordinator_update()
+    
+    async def async_update_todo_item(self, item: TodoItem) -> None:
+        """Complete the chore behind a checked-off item."""
+        chore = self.coordinator.chores_by_id.get(item.uid)
+        if chore is None:
+            raise HomeAssistantError(f"Unknown chore: {item.uid}")
+        if item.status != TodoItemStatus.COMPLETED:
+            raise HomeAssistantError("Tend chores can only be marked as completed")
+        user_id = self.coordinator.user_id_for_chore(chore)
+        if user_id is None:
+            raise HomeAssistantError("No household member to credit the chore to")
+        await self.coordinator.async_complete_chore(item.uid, user_id)
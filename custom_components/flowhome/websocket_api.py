@@ -0,0 +1,163 @@
+"""Websocket API for Tend dashboard cards."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN, SIGNAL_ENTRY_UNLOADED
+from .coordinator import FlowHomeCoordinator, RecordChanges
+from .query import assignee_keys
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the Tend websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+def _compact(record: dict[str, Any]) -> dict[str, Any]:
+    """Drop the id (used as the key) and empty fields from a record."""
+    return {
+        key: value for key, value in record.items()
+        if key != "id" and value is not None
+    }
+
+
+def _collect(
+    records: dict[str, dict[str, Any]],
+    changes: RecordChanges,
+    visible: set[str],
+    matches: Callable[[dict[str, Any]], bool],
+) -> tuple[dict[str, dict[str, Any]], list[str]]:
+    """Return the changed records a subscriber can see and the ids it lost."""
+    updated: dict[str, dict[str, Any]] = {}
+    removed = [rid for rid in changes.removed if rid in visible]
+    for rid in changes.changed:
+        if matches(records[rid]):
+            updated[rid] = _compact(records[rid])
+        elif rid in visible:
+            removed.append(rid)
+    visible.difference_update(removed)
+    visible.update(updated)
+    return updated, removed
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("entry_id"): str,
+        vol.Optional("room"): str,
+        vol.Optional("assignee"): str,
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send a household snapshot, then per-chore and per-user deltas."""
+    coordinators: dict[str, FlowHomeCoordinator] = hass.data.get(DOMAIN, {})
+    entry_id = msg.get("entry_id") or next(iter(coordinators), None)
+    if (coordinator := coordinators.get(entry_id)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Tend is not set up"
+        )
+        return
+    
+    room = msg.get("room")
+    assignee = msg.get("assignee")
+    assigned_to = None if assignee is None else assignee_keys(coordinator, assignee)
+    
+    def chore_matches(chore: dict[str, Any]) -> bool:
+        return (room is None or chore.get("room") == room) and (
+            assigned_to is None or chore.get("assigned_to") in assigned_to
+        )
+    
+    def user_matches(user: dict[str, Any]) -> bool:
+        return assignee is None or assignee in (user["id"], user.get("name"))
+    
+    visible_chores = {
+        cid for cid, chore in coordinator.chores_by_id.items() if chore_matches(chore)
+    }
+    visible_users = {
+        uid for uid, user in coordinator.users_by_id.items() if user_matches(user)
+    }
+    revision = coordinator.revision
+    
+    @callback
+    def async_forward_changes() -> None:
+        """Send what changed in the latest snapshot."""
+        nonlocal revision
+        if coordinator.revision == revision:
+            return
+        revision = coordinator.revision
+        chores, removed_chores = _collect(
+            coordinator.chores_by_id,
+            coordinator.chore_changes,
+            visible_chores,
+            chore_matches,
+        )
+        users, removed_users = _collect(
+            coordinator.users_by_id,
+            coordinator.user_changes,
+            visible_users,
+            user_matches,
+        )
+        if not (chores or removed_chores or users or removed_users):
+            return
+        delta: dict[str, Any] = {"revision": revision}
+        if chores:
+            delta["chores"] = chores
+        if removed_chores:
+            delta["removed_chores"] = removed_chores
+        if users:
+            delta["users"] = users
+        if removed_users:
+            delta["removed_users"] = removed_users
+        connection.send_message(websocket_api.event_message(msg["id"], delta))
+    
+    @callback
+    def async_entry_unloaded() -> None:
+        """End the subscription when its entry is unloaded or reloaded."""
+        connection.subscriptions.pop(msg["id"])()
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Tend was unloaded"
+        )
+    
+    unsubs = [
+        coordinator.async_add_listener(async_forward_changes),
+        async_dispatcher_connect(
+            hass, SIGNAL_ENTRY_UNLOADED.format(entry_id), async_entry_unloaded
+        ),
+    ]
+    
+    @callback
+    def async_unsubscribe() -> None:
+        """Detach from the coordinator and the unload signal."""
+        for unsub in unsubs:
+            unsub()
+    
+    connection.subscriptions[msg["id"]] = async_unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {
+                "snapshot": True,
+                "revision": revision,
+                "chores": {
+                    cid: _compact(coordinator.chores_by_id[cid]) for cid in visible_chores
+                },
+                "users": {
+                    uid: _compact(coordinator.users_by_id[uid]) for uid in visible_users
+                },
+            },
+        )
+    )